@@ -1,11 +1,12 @@
-import json
 import logging
 import asyncio
 from fastapi import APIRouter, HTTPException, Query, Depends
+from pydantic import TypeAdapter
 from sse_starlette.sse import EventSourceResponse
 
 from ..models.schemas import (
     ChatRequest,
+    SourceItem,
     ChatResponse,
     SessionResponse,
     SessionListResponse,
@@ -29,8 +30,8 @@ from ..models.database import (
     update_session_response_id,
     delete_session,
     add_message,
+    add_message_with_sources,
     get_messages,
-    save_sources,
     list_sessions,
     get_sources,
     update_message_content,
@@ -38,13 +39,15 @@ from ..models.database import (
 from ..services.openai_service import OpenAIService
 from ..services.pdf_memory import get_pdf_memory_store
 from ..services.chat_cancellation import get_chat_cancellation_manager
-from ..clients.base import RateLimitError, APIError
+from ..clients.base import RateLimitError, APIError, json_dumps, json_loads
 from ..clients.web_fetcher import WebFetcher
 from ..config import get_settings
 from ..security import require_api_key, rate_limit
 
 logger = logging.getLogger(__name__)
 
+_SOURCES_ADAPTER = TypeAdapter(list[SourceItem])
+
 router = APIRouter(prefix="/api", dependencies=[Depends(require_api_key), Depends(rate_limit)])
 
 
@@ -295,24 +298,14 @@ async def get_session_messages(session_id: str):
         messages = await get_messages(session_id)
         sources_rows = await get_sources(session_id)
         sources_by_message_id = {
-            row["message_id"]: json.loads(row["sources_json"])
+            row["message_id"]: json_loads(row["sources_json"])
             for row in sources_rows
         }
 
-        payload = []
         for message in messages:
-            message_id = message["id"]
-            payload.append(
-                {
-                    "id": message_id,
-                    "role": message["role"],
-                    "content": message["content"],
-                    "created_at": message["created_at"],
-                    "sources": sources_by_message_id.get(message_id),
-                }
-            )
+            message["sources"] = sources_by_message_id.get(message["id"])
 
-        return MessagesResponse(session_id=session_id, messages=payload)
+        return MessagesResponse(session_id=session_id, messages=messages)
     except Exception as e:
         logger.exception("Error fetching messages")
         raise HTTPException(status_code=500, detail=str(e))
@@ -423,10 +416,8 @@ async def chat(request: ChatRequest):
 
         await update_session_response_id(request.session_id, new_response_id)
 
-        assistant_message_id = await add_message(request.session_id, "assistant", answer_text)
-        if sources:
-            sources_json = json.dumps([s.model_dump() for s in sources])
-            await save_sources(request.session_id, assistant_message_id, sources_json)
+        sources_json = _SOURCES_ADAPTER.dump_json(sources).decode() if sources else None
+        await add_message_with_sources(request.session_id, "assistant", answer_text, sources_json)
 
         return ChatResponse(
             answer_text=answer_text,
@@ -540,18 +531,16 @@ async def chat_stream(request: ChatRequest):
 
                     if new_response_id:
                         await update_session_response_id(request.session_id, new_response_id)
-                    assistant_message_id = await add_message(
+                    await add_message_with_sources(
                         request.session_id,
                         "assistant",
                         final_answer,
+                        json_dumps(final_sources) if final_sources else None,
                     )
-                    if final_sources:
-                        sources_json = json.dumps(final_sources)
-                        await save_sources(request.session_id, assistant_message_id, sources_json)
 
                 yield {
                     "event": event_type,
-                    "data": json.dumps(event_data),
+                    "data": json_dumps(event_data),
                 }
 
         except asyncio.CancelledError:
@@ -559,7 +548,7 @@ async def chat_stream(request: ChatRequest):
         except RateLimitError as e:
             yield {
                 "event": "error",
-                "data": json.dumps({
+                "data": json_dumps({
                     "error": "rate_limit",
                     "message": "Rate limit exceeded. Please try again in a moment.",
                     "retry_after": e.retry_after,
@@ -568,7 +557,7 @@ async def chat_stream(request: ChatRequest):
         except ValueError as e:
             yield {
                 "event": "error",
-                "data": json.dumps({
+                "data": json_dumps({
                     "error": "bad_request",
                     "message": str(e),
                     "status_code": 400,
@@ -577,7 +566,7 @@ async def chat_stream(request: ChatRequest):
         except APIError as e:
             yield {
                 "event": "error",
-                "data": json.dumps({
+                "data": json_dumps({
                     "error": "api_error",
                     "message": str(e),
                     "status_code": e.status_code,
@@ -587,7 +576,7 @@ async def chat_stream(request: ChatRequest):
             logger.exception("Error in streaming chat")
             yield {
                 "event": "error",
-                "data": json.dumps({
+                "data": json_dumps({
                     "error": "internal_error",
                     "message": str(e),
                 }),
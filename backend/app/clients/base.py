@@ -1,14 +1,63 @@
 import asyncio
 import logging
+import random
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlsplit
 import httpx
 from cachetools import TTLCache
 
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(value) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    import json
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
 _cache: TTLCache = TTLCache(maxsize=1000, ttl=get_settings().cache_ttl)
+_stale_cache: TTLCache = TTLCache(maxsize=1000, ttl=get_settings().cache_ttl * 6)
+
+
+def running_loop_id() -> Optional[int]:
+    try:
+        return id(asyncio.get_running_loop())
+    except RuntimeError:
+        return None
+
+
+@lru_cache(maxsize=128)
+def _date_range_cached(days: int, bucket: int) -> tuple[str, str]:
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+
+
+def get_date_range(days: int) -> tuple[str, str]:
+    return _date_range_cached(days, int(time.time() // 60))
+
+
+async def close_loop_clients(clients: dict[tuple, httpx.AsyncClient]) -> None:
+    loop_id = running_loop_id()
+    for (client_loop, _), client in clients.items():
+        if client_loop in (loop_id, None):
+            await client.aclose()
 
 
 class RateLimitError(Exception):
@@ -24,7 +73,9 @@ class APIError(Exception):
 
 
 class BaseAPIClient:
-    _shared_clients: dict[float, httpx.AsyncClient] = {}
+    _shared_clients: dict[tuple, httpx.AsyncClient] = {}
+    _host_semaphores: dict[tuple, Optional[asyncio.Semaphore]] = {}
+    _circuit_state: dict[str, tuple[int, float]] = {}
 
     def __init__(self, base_url: str, timeout: float = 30.0):
         self.base_url = base_url
@@ -36,20 +87,51 @@ class BaseAPIClient:
 
     @classmethod
     def _get_shared_client(cls, timeout: float) -> httpx.AsyncClient:
-        client = cls._shared_clients.get(timeout)
+        key = (running_loop_id(), timeout)
+        client = cls._shared_clients.get(key)
         if client:
             return client
         limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
-        client = httpx.AsyncClient(timeout=timeout, limits=limits)
-        cls._shared_clients[timeout] = client
+        client = httpx.AsyncClient(timeout=timeout, limits=limits, http2=HTTP2_AVAILABLE)
+        cls._shared_clients[key] = client
         return client
 
     @classmethod
     async def close_shared_clients(cls) -> None:
-        for client in cls._shared_clients.values():
-            await client.aclose()
+        await close_loop_clients(cls._shared_clients)
         cls._shared_clients = {}
 
+    def _retry_delay(self, wait_time: float, spread: float = 0.5) -> float:
+        wait_time = min(wait_time, self.settings.max_backoff)
+        return wait_time * random.uniform(1 - spread, 1 + spread)
+
+    def _get_host_semaphore(self, host: str) -> Optional[asyncio.Semaphore]:
+        key = (running_loop_id(), host)
+        if key in self._host_semaphores:
+            return self._host_semaphores[key]
+        limit = self.settings.http_host_concurrency_overrides.get(
+            host, self.settings.http_host_concurrency
+        )
+        semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+        self._host_semaphores[key] = semaphore
+        return semaphore
+
+    def _is_circuit_open(self, host: str) -> bool:
+        failures, last_failure = self._circuit_state.get(host, (0, 0.0))
+        if failures < self.settings.circuit_breaker_threshold:
+            return False
+        return time.monotonic() - last_failure < self.settings.circuit_breaker_cooldown
+
+    def _record_failure(self, host: str) -> None:
+        failures, _ = self._circuit_state.get(host, (0, 0.0))
+        failures += 1
+        self._circuit_state[host] = (failures, time.monotonic())
+        if failures == self.settings.circuit_breaker_threshold:
+            logger.warning(f"Circuit opened for {host} after {failures} consecutive failures")
+
+    def _record_success(self, host: str) -> None:
+        self._circuit_state.pop(host, None)
+
     def _get_cache_key(self, method: str, url: str, params: Optional[dict] = None) -> str:
         param_str = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
         return f"{method}:{url}?{param_str}"
@@ -78,22 +160,49 @@ class BaseAPIClient:
             logger.debug(f"Cache hit for {cache_key}")
             return _cache[cache_key]
 
+        stale: Optional[tuple[Optional[str], dict]] = None
+        if use_cache and method.upper() == "GET":
+            stale = _stale_cache.get(cache_key)
+
+        host = urlsplit(url).netloc
+        if self._is_circuit_open(host):
+            if stale:
+                logger.warning(f"Circuit open for {host}; serving stale result for {cache_key}")
+                return stale[1]
+            raise APIError(
+                f"Upstream {host} is temporarily unavailable. Please try again shortly.",
+                status_code=503,
+            )
+
+        if stale and stale[0]:
+            headers = {**(headers or {}), "If-None-Match": stale[0]}
+
         backoff = self.settings.initial_backoff
         last_error: Optional[Exception] = None
+        semaphore = self._get_host_semaphore(host)
 
         for attempt in range(self.settings.max_retries + 1):
             try:
-                response = await self._client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    json=json,
-                    timeout=self.timeout,
-                )
+                async with semaphore or nullcontext():
+                    response = await self._client.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        params=params,
+                        json=json,
+                        timeout=self.timeout,
+                    )
 
                 self._parse_rate_limit_headers(response.headers)
 
+                if response.status_code == 304 and stale and stale[0]:
+                    logger.debug(f"Not modified (304) for {cache_key}")
+                    self._record_success(host)
+                    data = stale[1]
+                    _cache[cache_key] = data
+                    _stale_cache[cache_key] = stale
+                    return data
+
                 if response.status_code == 429:
                     retry_after = response.headers.get("Retry-After")
                     wait_time = float(retry_after) if retry_after else backoff
@@ -104,8 +213,9 @@ class BaseAPIClient:
                     )
 
                     if attempt < self.settings.max_retries:
-                        await asyncio.sleep(wait_time)
-                        backoff *= 2
+                        spread = 0.1 if retry_after else 0.5
+                        await asyncio.sleep(self._retry_delay(wait_time, spread))
+                        backoff = min(backoff * 2, self.settings.max_backoff)
                         continue
                     else:
                         raise RateLimitError(
@@ -119,6 +229,8 @@ class BaseAPIClient:
                     preview = error_text[:800]
                     if "text/html" in (content_type or "").lower():
                         preview = "HTML error page returned (truncated)."
+                    if response.status_code >= 500:
+                        self._record_failure(host)
                     logger.error(
                         "API error %s (%s): %s",
                         response.status_code,
@@ -130,10 +242,12 @@ class BaseAPIClient:
                         status_code=response.status_code,
                     )
 
-                data = response.json()
+                data = json_loads(response.content)
+                self._record_success(host)
 
                 if use_cache and method.upper() == "GET":
                     _cache[cache_key] = data
+                    _stale_cache[cache_key] = (response.headers.get("ETag"), data)
 
                 return data
 
@@ -141,18 +255,19 @@ class BaseAPIClient:
                 last_error = e
                 logger.warning(f"Request timeout. Attempt {attempt + 1}")
                 if attempt < self.settings.max_retries:
-                    await asyncio.sleep(backoff)
-                    backoff *= 2
+                    await asyncio.sleep(self._retry_delay(backoff))
+                    backoff = min(backoff * 2, self.settings.max_backoff)
                     continue
 
             except httpx.RequestError as e:
                 last_error = e
                 logger.error(f"Request error: {e}")
                 if attempt < self.settings.max_retries:
-                    await asyncio.sleep(backoff)
-                    backoff *= 2
+                    await asyncio.sleep(self._retry_delay(backoff))
+                    backoff = min(backoff * 2, self.settings.max_backoff)
                     continue
 
+        self._record_failure(host)
         raise APIError(f"Request failed after retries: {last_error}")
 
     @property
@@ -108,7 +108,7 @@ class CongressClient(BaseAPIClient):
                 or query_lower in (b.get("number", "") or "").lower()
             ]
 
-        sources = [self._normalize_bill(bill) for bill in bills[:limit]]
+        sources = list(map(self._normalize_bill, bills[:limit]))
         return bills[:limit], sources
 
     async def get_bill(
@@ -165,5 +165,6 @@ class CongressClient(BaseAPIClient):
         if not votes and "vote" in data:
             votes = [data["vote"]]
 
-        sources = [self._normalize_vote(vote, chamber) for vote in votes[:limit]]
+        normalize = self._normalize_vote
+        sources = [normalize(vote, chamber) for vote in votes[:limit]]
         return votes[:limit], sources
@@ -86,6 +86,6 @@ class DataGovClient(BaseAPIClient):
 
         result = data.get("result", {})
         datasets = result.get("results", [])
-        sources = [self._normalize_dataset(ds) for ds in datasets]
+        sources = list(map(self._normalize_dataset, datasets))
 
         return datasets, sources
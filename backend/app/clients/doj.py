@@ -107,5 +107,5 @@ class DOJClient(BaseAPIClient):
                     filtered.append(release)
             releases = filtered
 
-        sources = [self._normalize_press_release(r) for r in releases[:limit]]
+        sources = list(map(self._normalize_press_release, releases[:limit]))
         return releases[:limit], sources
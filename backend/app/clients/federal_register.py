@@ -69,7 +69,7 @@ class FederalRegisterClient(BaseAPIClient):
         )
 
         documents = data.get("results", [])
-        sources = [self._normalize_document(doc) for doc in documents]
+        sources = list(map(self._normalize_document, documents))
 
         return documents, sources
 
@@ -145,7 +145,8 @@ class FiscalDataClient(BaseAPIClient):
         )
 
         records = data.get("data", [])
-        sources = [self._normalize_fiscal(r, dataset) for r in records]
+        normalize = self._normalize_fiscal
+        sources = [normalize(r, dataset) for r in records]
         brief = self._format_fiscal_brief(data, dataset)
 
         return records, sources, brief
@@ -5,23 +5,21 @@ from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 import httpx
 
-try:
-    import h2  # noqa: F401
-    _HTTP2_AVAILABLE = True
-except ImportError:
-    _HTTP2_AVAILABLE = False
-
-from .base import BaseAPIClient
+from .base import BaseAPIClient, HTTP2_AVAILABLE, close_loop_clients, running_loop_id
 from .html_utils import html_to_text
-from .pdf_utils import extract_pdf_images_sync, extract_pdf_text_sync
+from .pdf_utils import extract_pdf_images_sync, extract_pdf_text_sync, run_pdf_task
 from ..config import get_settings
 from ..models.schemas import SourceItem
 
 logger = logging.getLogger(__name__)
 
+_NON_PRINTABLE_BYTES = bytes(
+    b for b in range(256) if not (32 <= b <= 126 or b in (9, 10, 13))
+)
+
 
 class GovInfoClient(BaseAPIClient):
-    _shared_content_clients: dict[float, httpx.AsyncClient] = {}
+    _shared_content_clients: dict[tuple, httpx.AsyncClient] = {}
 
     def __init__(self):
         settings = get_settings()
@@ -31,22 +29,27 @@ class GovInfoClient(BaseAPIClient):
 
     @classmethod
     def _get_content_client(cls, timeout: float) -> httpx.AsyncClient:
-        client = cls._shared_content_clients.get(timeout)
+        key = (running_loop_id(), timeout)
+        client = cls._shared_content_clients.get(key)
         if client:
             return client
+        settings = get_settings()
         client = httpx.AsyncClient(
             timeout=timeout,
             follow_redirects=True,
-            http2=_HTTP2_AVAILABLE,
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
         )
-        cls._shared_content_clients[timeout] = client
+        cls._shared_content_clients[key] = client
         return client
 
     @classmethod
     async def close_shared_clients(cls) -> None:
-        for client in cls._shared_content_clients.values():
-            await client.aclose()
+        await close_loop_clients(cls._shared_content_clients)
         cls._shared_content_clients = {}
 
     def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
@@ -65,6 +68,37 @@ class GovInfoClient(BaseAPIClient):
             except Exception:
                 return None
 
+    async def _get_capped(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Optional[dict],
+    ) -> Optional[httpx.Response]:
+        max_bytes = self.settings.fetch_max_response_bytes
+        async with client.stream("GET", url, params=params) as response:
+            declared = response.headers.get("content-length", "")
+            if max_bytes > 0 and declared.isdigit() and int(declared) > max_bytes:
+                return None
+            chunks = []
+            total = 0
+            async for chunk in response.aiter_bytes(chunk_size=65536):
+                total += len(chunk)
+                if max_bytes > 0 and total > max_bytes:
+                    return None
+                chunks.append(chunk)
+
+        headers = [
+            (key, value)
+            for key, value in response.headers.multi_items()
+            if key.lower() not in ("content-encoding", "content-length")
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=b"".join(chunks),
+            request=response.request,
+        )
+
     async def _fetch_url_with_retry(
         self,
         client: httpx.AsyncClient,
@@ -76,34 +110,42 @@ class GovInfoClient(BaseAPIClient):
 
         for attempt in range(max_attempts):
             try:
-                response = await client.get(url, params=params)
+                response = await self._get_capped(client, url, params)
             except httpx.TimeoutException:
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, 30.0)
+                    await asyncio.sleep(self._retry_delay(backoff))
+                    backoff = min(backoff * 2, self.settings.max_backoff)
                     continue
                 return None
             except httpx.RequestError:
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, 30.0)
+                    await asyncio.sleep(self._retry_delay(backoff))
+                    backoff = min(backoff * 2, self.settings.max_backoff)
                     continue
                 return None
 
+            if response is None:
+                logger.warning("GovInfo content too large, skipping: %s", url)
+                return None
+
             if response.status_code == 429:
                 retry_after = self._parse_retry_after(
                     response.headers.get("Retry-After")
                 )
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(retry_after or backoff)
-                    backoff = min(backoff * 2, 30.0)
+                    await asyncio.sleep(
+                        self._retry_delay(retry_after, 0.1)
+                        if retry_after
+                        else self._retry_delay(backoff)
+                    )
+                    backoff = min(backoff * 2, self.settings.max_backoff)
                     continue
                 return response
 
             if response.status_code == 408 or response.status_code >= 500:
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, 30.0)
+                    await asyncio.sleep(self._retry_delay(backoff))
+                    backoff = min(backoff * 2, self.settings.max_backoff)
                     continue
                 return response
 
@@ -117,10 +159,7 @@ class GovInfoClient(BaseAPIClient):
         sample = content[:1024]
         if b"\x00" in sample:
             return False
-        printable = sum(
-            1 for b in sample
-            if 32 <= b <= 126 or b in (9, 10, 13)
-        )
+        printable = len(sample.translate(None, _NON_PRINTABLE_BYTES))
         return printable / len(sample) > 0.85
 
     def _is_supported_text_type(self, content_type: str, content: bytes) -> bool:
@@ -216,7 +255,7 @@ class GovInfoClient(BaseAPIClient):
         )
 
         results = data.get("results", [])
-        sources = [self._normalize_search_result(r) for r in results]
+        sources = list(map(self._normalize_search_result, results))
 
         return data, sources
 
@@ -289,7 +328,7 @@ class GovInfoClient(BaseAPIClient):
                         params,
                     )
                     if pdf_response and pdf_response.status_code == 200:
-                        extracted_images, skipped = await asyncio.to_thread(
+                        extracted_images, skipped = await run_pdf_task(
                             extract_pdf_images_sync,
                             pdf_response.content,
                         )
@@ -311,17 +350,24 @@ class GovInfoClient(BaseAPIClient):
                 params,
             )
             if pdf_response and pdf_response.status_code == 200:
-                pdf_text = await asyncio.to_thread(
-                    extract_pdf_text_sync,
-                    pdf_response.content,
-                    max_length,
-                )
-                should_extract_images = self.settings.pdf_extract_images or not pdf_text
-                if should_extract_images:
-                    extracted_images, skipped = await asyncio.to_thread(
-                        extract_pdf_images_sync,
+                extracted_images = None
+                if self.settings.pdf_extract_images:
+                    pdf_text, (extracted_images, skipped) = await asyncio.gather(
+                        run_pdf_task(extract_pdf_text_sync, pdf_response.content, max_length),
+                        run_pdf_task(extract_pdf_images_sync, pdf_response.content),
+                    )
+                else:
+                    pdf_text = await run_pdf_task(
+                        extract_pdf_text_sync,
                         pdf_response.content,
+                        max_length,
                     )
+                    if not pdf_text:
+                        extracted_images, skipped = await run_pdf_task(
+                            extract_pdf_images_sync,
+                            pdf_response.content,
+                        )
+                if extracted_images is not None:
                     logger.info(
                         "GovInfo PDF extracted for %s: text=%s images=%s skipped=%s",
                         package_id,
@@ -368,7 +414,7 @@ class GovInfoClient(BaseAPIClient):
         )
 
         packages = data.get("packages", [])
-        sources = [self._normalize_package(p) for p in packages]
+        sources = list(map(self._normalize_package, packages))
 
         return data, sources
 
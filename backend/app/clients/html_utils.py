@@ -1,39 +1,54 @@
 import re
+from html import unescape
 from typing import Optional
 
+_DOTALL_I = re.DOTALL | re.IGNORECASE
+
+_DROPPED_BLOCK_RE = re.compile(
+    r"<(?:!--.*?-->|(script|style|head|nav|footer)[^>]*>.*?</\1>)",
+    _DOTALL_I,
+)
+_LINE_BREAK_RE = re.compile(
+    r"<(?:/(?:p|div|h[1-6]|li|tr|section|article)|br|hr)[^>]*>",
+    re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+_UNCLOSED_BLOCK_RE = re.compile(r"<(?:!--|(?:script|style|head|nav|footer)\b)", re.IGNORECASE)
+_PREFIX_FACTOR = 20
+
+
+def _extract_text(html: str, partial: bool = False) -> str:
+    html = _DROPPED_BLOCK_RE.sub("", html)
+    if partial:
+        unclosed = _UNCLOSED_BLOCK_RE.search(html)
+        if unclosed:
+            html = html[:unclosed.start()]
+        open_tag = html.rfind("<")
+        if open_tag > html.rfind(">"):
+            html = html[:open_tag]
+    html = _LINE_BREAK_RE.sub("\n", html)
+    text = _TAG_RE.sub(" ", html)
+
+    text = unescape(text)
+    text = "\n".join([" ".join(line.split()) for line in text.split("\n")])
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    return text.strip()
+
 
 def html_to_text(html: str, max_length: Optional[int] = 15000) -> str:
-    html = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r"<style[^>]*>.*?</style>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r"<head[^>]*>.*?</head>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r"<nav[^>]*>.*?</nav>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r"<footer[^>]*>.*?</footer>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r"<!--.*?-->", "", html, flags=re.DOTALL)
-
-    html = re.sub(r"</(p|div|h[1-6]|li|tr|section|article)[^>]*>", "\n", html, flags=re.IGNORECASE)
-    html = re.sub(r"<(br|hr)[^>]*/?>", "\n", html, flags=re.IGNORECASE)
-
-    text = re.sub(r"<[^>]+>", " ", html)
-
-    entities = {
-        "&nbsp;": " ", "&amp;": "&", "&lt;": "<", "&gt;": ">",
-        "&quot;": "\"", "&#39;": "'", "&apos;": "'",
-        "&mdash;": "--", "&ndash;": "-", "&hellip;": "...",
-        "&copy;": "(c)", "&reg;": "(R)", "&trade;": "(TM)",
-    }
-    for entity, char in entities.items():
-        text = text.replace(entity, char)
-
-    text = re.sub(r"&#(\\d+);", lambda m: chr(int(m.group(1))), text)
-    text = re.sub(r"&#x([0-9a-fA-F]+);", lambda m: chr(int(m.group(1), 16)), text)
-
-    text = re.sub(r"[ \\t]+", " ", text)
-    text = re.sub(r"\\n[ \\t]+", "\\n", text)
-    text = re.sub(r"[ \\t]+\\n", "\\n", text)
-    text = re.sub(r"\\n{3,}", "\\n\\n", text)
-    text = text.strip()
-
-    if max_length is not None and max_length > 0 and len(text) > max_length:
+    limited = max_length is not None and max_length > 0
+    text = None
+    if limited and len(html) > max_length * _PREFIX_FACTOR:
+        text = _extract_text(html[:max_length * _PREFIX_FACTOR], partial=True)
+        if len(text) <= max_length:
+            text = None
+    if text is None:
+        text = _extract_text(html)
+
+    if limited and len(text) > max_length:
         truncated = text[:max_length]
         last_period = truncated.rfind(".")
         if last_period > max_length * 0.8:
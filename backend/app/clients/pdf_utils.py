@@ -1,6 +1,12 @@
+import asyncio
 import base64
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
-from typing import Optional
+from typing import Callable, Optional
+
+from ..config import get_settings
 
 try:
     from pypdf import PdfReader
@@ -22,6 +28,39 @@ try:
 except ImportError:
     PDF_IMAGE_AVAILABLE = False
 
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pdf_executor() -> Optional[ProcessPoolExecutor]:
+    global _pdf_executor
+    if _pdf_executor is None:
+        workers = get_settings().pdf_process_workers
+        if workers <= 0:
+            return None
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pdf_executor
+
+
+async def run_pdf_task(func: Callable, *args):
+    executor = _get_pdf_executor()
+    if executor is None:
+        return await asyncio.to_thread(func, *args)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        shutdown_pdf_executor()
+        return await asyncio.to_thread(func, *args)
+
+
+def shutdown_pdf_executor() -> None:
+    global _pdf_executor
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown(wait=False, cancel_futures=True)
+        _pdf_executor = None
+
 
 def extract_pdf_text_sync(
     content: bytes,
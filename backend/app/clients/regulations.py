@@ -1,6 +1,5 @@
 import logging
 from typing import Optional
-from datetime import datetime, timedelta
 
 from .base import BaseAPIClient
 from ..config import get_settings
@@ -85,7 +84,7 @@ class RegulationsClient(BaseAPIClient):
         )
 
         documents = data.get("data", [])
-        sources = [self._normalize_document(doc) for doc in documents]
+        sources = list(map(self._normalize_document, documents))
 
         return documents, sources
 
@@ -136,7 +135,7 @@ class RegulationsClient(BaseAPIClient):
         )
 
         dockets = data.get("data", [])
-        sources = [self._normalize_docket(docket) for docket in dockets]
+        sources = list(map(self._normalize_docket, dockets))
 
         return dockets, sources
 
@@ -154,9 +153,3 @@ class RegulationsClient(BaseAPIClient):
         source = self._normalize_docket(docket)
 
         return docket, source
-
-
-def get_date_range(days: int) -> tuple[str, str]:
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
@@ -57,6 +57,6 @@ class SearchGovClient(BaseAPIClient):
         )
 
         web_results = data.get("web", {}).get("results", [])
-        sources = [self._normalize_result(r) for r in web_results]
+        sources = list(map(self._normalize_result, web_results))
 
         return web_results, sources
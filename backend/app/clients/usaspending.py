@@ -1,8 +1,7 @@
 import logging
 from typing import Optional, Any
-from datetime import datetime, timedelta
 
-from .base import BaseAPIClient
+from .base import BaseAPIClient, get_date_range
 from ..config import get_settings
 from ..models.schemas import SourceItem
 
@@ -35,6 +34,26 @@ class USASpendingClient(BaseAPIClient):
             return f"${amount / 1_000:.2f}K"
         return f"${amount:.2f}"
 
+    def _award_amount(self, result: dict) -> Optional[float]:
+        return (
+            result.get("Award Amount")
+            or result.get("total_obligations")
+            or result.get("obligated_amount")
+            or result.get("amount")
+        )
+
+    def _award_agency(self, result: dict) -> Optional[str]:
+        agency = result.get("Awarding Agency")
+        if agency:
+            return agency
+        awarding = result.get("awarding_agency")
+        if isinstance(awarding, dict):
+            return (awarding.get("toptier_agency") or {}).get("name")
+        return None
+
+    def _award_description(self, result: dict) -> Optional[str]:
+        return result.get("Award Description") or result.get("description")
+
     def _format_spending_brief(self, data: dict, query_context: str = "") -> str:
         lines = ["# USAspending Summary\n"]
 
@@ -49,14 +68,8 @@ class USASpendingClient(BaseAPIClient):
 
         lines.append(f"**Total Results:** {len(results)}\n")
 
-        total_obligations = sum(
-            r.get("Award Amount", 0)
-            or r.get("total_obligations", 0)
-            or r.get("obligated_amount", 0)
-            or r.get("amount", 0)
-            or 0
-            for r in results
-        )
+        award_amount = self._award_amount
+        total_obligations = sum(award_amount(r) or 0 for r in results)
         if total_obligations:
             lines.append(f"**Total Obligations:** {self._format_currency(total_obligations)}\n")
 
@@ -66,23 +79,17 @@ class USASpendingClient(BaseAPIClient):
             name = (
                 result.get("Recipient Name")
                 or result.get("recipient_name")
-                or result.get("Awarding Agency")
-                or result.get("awarding_agency", {}).get("toptier_agency", {}).get("name")
+                or self._award_agency(result)
                 or result.get("name")
                 or f"Result {i}"
             )
-            amount = (
-                result.get("Award Amount")
-                or result.get("total_obligations")
-                or result.get("obligated_amount")
-                or result.get("amount")
-            )
-            
+            amount = award_amount(result)
+
             lines.append(f"### {i}. {name}")
             if amount:
                 lines.append(f"- **Amount:** {self._format_currency(amount)}")
-            
-            description = result.get("Award Description") or result.get("description")
+
+            description = self._award_description(result)
             if description:
                 lines.append(f"- **Description:** {str(description)[:200]}...")
             
@@ -104,24 +111,20 @@ class USASpendingClient(BaseAPIClient):
             or str(hash(str(result)))[:12]
         )
 
+        description = self._award_description(result)
         title = (
             result.get("Recipient Name")
             or result.get("recipient_name")
-            or (result.get("Award Description") or result.get("description") or "")[:100]
+            or (description or "")[:100]
             or f"Spending Record {item_id}"
         )
 
-        agency = None
-        if result.get("Awarding Agency"):
-            agency = result.get("Awarding Agency")
-        elif result.get("awarding_agency"):
-            agency = result["awarding_agency"].get("toptier_agency", {}).get("name")
+        agency = self._award_agency(result)
 
         url = f"https://www.usaspending.gov/award/{item_id}" if item_id else "https://www.usaspending.gov"
 
-        amount = result.get("Award Amount") or result.get("total_obligations") or result.get("obligated_amount")
+        amount = self._award_amount(result)
         excerpt = f"Amount: {self._format_currency(amount)}" if amount else None
-        description = result.get("Award Description") or result.get("description")
         if description:
             excerpt = (excerpt + " - " if excerpt else "") + str(description)[:200]
         
@@ -182,11 +185,10 @@ class USASpendingClient(BaseAPIClient):
             )
         filters["award_type_codes"] = type_map[effective_award_type]
 
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        start_date, end_date = get_date_range(days)
         filters["time_period"] = [{
-            "start_date": start_date.strftime("%Y-%m-%d"),
-            "end_date": end_date.strftime("%Y-%m-%d"),
+            "start_date": start_date,
+            "end_date": end_date,
         }]
 
         payload = {
@@ -208,7 +210,7 @@ class USASpendingClient(BaseAPIClient):
         )
 
         results = data.get("results", [])
-        sources = [self._normalize_spending(r) for r in results]
+        sources = list(map(self._normalize_spending, results))
         brief = self._format_spending_brief(data, str(keywords))
 
         return results, sources, brief
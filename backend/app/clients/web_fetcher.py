@@ -1,60 +1,157 @@
 import asyncio
+import codecs
+import copy
 import ipaddress
 import logging
+import random
 import re
 import socket
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from html import unescape
 from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
+from cachetools import TTLCache
 
+_ACCEPT_ENCODINGS = ["gzip", "deflate"]
 try:
-    import h2  # noqa: F401
-    _HTTP2_AVAILABLE = True
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODINGS.append("br")
 except ImportError:
-    _HTTP2_AVAILABLE = False
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODINGS.append("br")
+    except ImportError:
+        pass
+
+try:
+    import zstandard  # noqa: F401
+    _ACCEPT_ENCODINGS.append("zstd")
+except ImportError:
+    pass
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _SELECTOLAX_AVAILABLE = True
+except ImportError:
+    _SELECTOLAX_AVAILABLE = False
 
 from ..config import get_settings
+from .base import HTTP2_AVAILABLE, close_loop_clients, json_loads, running_loop_id
 from .html_utils import html_to_text
 from .pdf_utils import (
     extract_pdf_images_sync,
     extract_pdf_text_sync,
     PDF_IMAGE_AVAILABLE,
     PDF_TEXT_AVAILABLE,
+    run_pdf_task,
 )
 
 logger = logging.getLogger(__name__)
 
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_MAIN_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r'<main[^>]*>(.*?)</main>',
+        r'<article[^>]*>(.*?)</article>',
+        r'<div[^>]*class="[^"]*content[^"]*"[^>]*>(.*?)</div>',
+        r'<div[^>]*id="[^"]*content[^"]*"[^>]*>(.*?)</div>',
+    )
+)
+_MAIN_SELECTORS = ("main", "article", "div[class*=content]", "div[id*=content]")
+_READ_CHUNK_SIZE = 65536
+_NON_DOCUMENT_CONTENT_TYPES = ("video/", "audio/", "image/", "font/")
+_NON_PRINTABLE_BYTES = bytes(
+    b for b in range(256) if not (32 <= b <= 126 or b in (9, 10, 13))
+)
+
+_host_resolution_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_pending_resolutions: dict[str, asyncio.Future] = {}
+_fetch_result_cache: TTLCache = TTLCache(maxsize=256, ttl=get_settings().cache_ttl)
+_pending_fetches: dict[tuple, asyncio.Future] = {}
+_bot_blocked_hosts: TTLCache = TTLCache(maxsize=512, ttl=600)
+
+_BOT_HEADERS = {
+    "User-Agent": "PolicyRadarBot/1.0 (Federal Policy Research Tool)",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": ", ".join(_ACCEPT_ENCODINGS),
+}
+_BROWSER_HEADERS = {
+    **_BOT_HEADERS,
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36"
+    ),
+}
+
+
+@lru_cache(maxsize=16)
+def _domain_matcher(domains: tuple[str, ...]) -> tuple[frozenset[str], tuple[str, ...]]:
+    exact = set()
+    suffixes = []
+    for entry in domains:
+        domain = entry.lower().strip()
+        if not domain:
+            continue
+        if domain.startswith("."):
+            suffixes.append(domain)
+        else:
+            exact.add(domain)
+            suffixes.append(f".{domain}")
+    return frozenset(exact), tuple(suffixes)
+
+
+@lru_cache(maxsize=64)
+def _resolve_encoding(label: str) -> str:
+    try:
+        return codecs.lookup(label).name
+    except LookupError:
+        return "utf-8"
+
 
 class WebFetcher:
-    _shared_clients: dict[float, httpx.AsyncClient] = {}
+    _shared_clients: dict[tuple, httpx.AsyncClient] = {}
 
     def __init__(self, timeout: float = 30.0):
         self.timeout = timeout
         self.settings = get_settings()
+        self._allowed_domains = tuple(self.settings.fetch_allowed_domains)
+        self._api_headers = {
+            "X-Api-Key": self.settings.gov_api_key,
+            "Accept": "application/json",
+        }
         self._client = self._get_shared_client(timeout)
 
     @classmethod
     def _get_shared_client(cls, timeout: float) -> httpx.AsyncClient:
-        client = cls._shared_clients.get(timeout)
+        key = (running_loop_id(), timeout)
+        client = cls._shared_clients.get(key)
         if client:
             return client
+        settings = get_settings()
         client = httpx.AsyncClient(
             timeout=httpx.Timeout(timeout),
             follow_redirects=True,
             max_redirects=10,
-            http2=_HTTP2_AVAILABLE,
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
         )
-        cls._shared_clients[timeout] = client
+        cls._shared_clients[key] = client
         return client
 
     @classmethod
     async def close_shared_clients(cls) -> None:
-        for client in cls._shared_clients.values():
-            await client.aclose()
+        await close_loop_clients(cls._shared_clients)
         cls._shared_clients = {}
 
     def _normalize_url(self, url: str) -> str:
@@ -62,6 +159,9 @@ class WebFetcher:
         if not url:
             raise ValueError("Missing URL")
 
+        if url[:8].lower().startswith(("https://", "http://")):
+            return url
+
         parsed = urlparse(url)
         if not parsed.scheme:
             url = f"https://{url}"
@@ -73,21 +173,12 @@ class WebFetcher:
         return url
 
     def _is_host_allowed(self, host: str) -> bool:
-        allowed = self.settings.fetch_allowed_domains
-        if not allowed:
+        if not self._allowed_domains:
             return True
 
+        exact, suffixes = _domain_matcher(self._allowed_domains)
         host = host.lower()
-        for entry in allowed:
-            domain = entry.lower().strip()
-            if not domain:
-                continue
-            if domain.startswith("."):
-                if host.endswith(domain):
-                    return True
-            elif host == domain or host.endswith(f".{domain}"):
-                return True
-        return False
+        return host in exact or host.endswith(suffixes)
 
     def _is_blocked_ip(self, ip: ipaddress._BaseAddress) -> bool:
         return (
@@ -98,6 +189,22 @@ class WebFetcher:
             or ip.is_multicast
         )
 
+    async def _resolve_host(self, host: str) -> list:
+        pending = _pending_resolutions.get(host)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                asyncio.to_thread(
+                    socket.getaddrinfo,
+                    host,
+                    None,
+                    type=socket.SOCK_STREAM,
+                    flags=socket.AI_NUMERICSERV,
+                )
+            )
+            _pending_resolutions[host] = pending
+            pending.add_done_callback(lambda _: _pending_resolutions.pop(host, None))
+        return await asyncio.shield(pending)
+
     async def _validate_host(self, host: str) -> None:
         if not host:
             raise ValueError("Missing host")
@@ -109,15 +216,22 @@ class WebFetcher:
             raise ValueError("URL host is not allowed.")
 
         try:
-            ip = ipaddress.ip_address(host)
-            if self._is_blocked_ip(ip):
+            literal_ip = ipaddress.ip_address(host)
+        except ValueError:
+            literal_ip = None
+        if literal_ip is not None:
+            if self._is_blocked_ip(literal_ip):
                 raise ValueError("URL resolves to a private or local address.")
             return
-        except ValueError:
-            pass
+
+        cached_error = _host_resolution_cache.get(host)
+        if cached_error is not None:
+            if cached_error:
+                raise ValueError(cached_error)
+            return
 
         try:
-            infos = await asyncio.to_thread(socket.getaddrinfo, host, None)
+            infos = await self._resolve_host(host)
         except Exception:
             raise ValueError("Unable to resolve host.")
 
@@ -128,7 +242,11 @@ class WebFetcher:
             except ValueError:
                 continue
             if self._is_blocked_ip(ip):
-                raise ValueError("URL resolves to a private or local address.")
+                error = "URL resolves to a private or local address."
+                _host_resolution_cache[host] = error
+                raise ValueError(error)
+
+        _host_resolution_cache[host] = ""
 
     async def _normalize_and_validate_url(self, url: str) -> str:
         normalized = self._normalize_url(url)
@@ -155,9 +273,9 @@ class WebFetcher:
     def _is_probably_pdf(self, content_type: str, url: str, content: bytes) -> bool:
         if "application/pdf" in content_type:
             return True
-        if url.lower().endswith(".pdf"):
+        if url[-4:].lower() == ".pdf":
             return True
-        return content[:4] == b"%PDF"
+        return content.startswith(b"%PDF")
 
     def _looks_like_text(self, content: bytes) -> bool:
         if not content:
@@ -165,10 +283,7 @@ class WebFetcher:
         sample = content[:1024]
         if b"\x00" in sample:
             return False
-        printable = sum(
-            1 for b in sample
-            if 32 <= b <= 126 or b in (9, 10, 13)
-        )
+        printable = len(sample.translate(None, _NON_PRINTABLE_BYTES))
         return printable / len(sample) > 0.85
 
     def _is_supported_content_type(self, content_type: str, content: bytes) -> bool:
@@ -186,25 +301,56 @@ class WebFetcher:
 
         return False
 
+    def _is_rejected_content_type(self, content_type: str, url: str) -> bool:
+        if url[-4:].lower() == ".pdf":
+            return False
+        return content_type.startswith(_NON_DOCUMENT_CONTENT_TYPES)
+
+    def _extract_title_and_main(self, html: str) -> tuple[Optional[str], str]:
+        if _SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(html)
+            title = None
+            title_node = tree.css_first("title")
+            if title_node is not None:
+                title = " ".join(title_node.text().split())[:200] or None
+            for selector in _MAIN_SELECTORS:
+                node = tree.css_first(selector)
+                if node is None:
+                    continue
+                inner = node.inner_html or ""
+                if len(inner) > 500:
+                    return title, inner
+            return title, html
+
+        title = None
+        title_match = _TITLE_RE.search(html)
+        if title_match:
+            title = " ".join(unescape(title_match.group(1)).split())[:200] or None
+
+        lowered = html.lower()
+        if "<main" not in lowered and "<article" not in lowered and "content" not in lowered:
+            return title, html
+
+        for pattern in _MAIN_PATTERNS:
+            match = pattern.search(html)
+            if match and len(match.group(1)) > 500:
+                return title, match.group(1)
+        return title, html
+
     def _build_headers(self, variant: str = "bot") -> dict:
         if variant == "browser":
-            return {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/122.0.0.0 Safari/537.36"
-                ),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate",
-            }
-
-        return {
-            "User-Agent": "PolicyRadarBot/1.0 (Federal Policy Research Tool)",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate",
-        }
+            return _BROWSER_HEADERS
+        return _BOT_HEADERS
+
+    def _header_variants(self, url: str) -> tuple[str, ...]:
+        if urlparse(url).hostname in _bot_blocked_hosts:
+            return ("browser",)
+        return ("bot", "browser")
+
+    def _mark_bot_blocked(self, url: str) -> None:
+        host = urlparse(url).hostname
+        if host:
+            _bot_blocked_hosts[host] = True
 
     async def _read_response_bytes(
         self,
@@ -214,20 +360,40 @@ class WebFetcher:
         if max_bytes <= 0:
             return await response.aread()
 
+        content_type = (response.headers.get("content-type") or "").lower()
+        truncatable = content_type.startswith("text/") or "html" in content_type
+
+        expected = 0
         content_length = response.headers.get("content-length")
         if content_length:
             try:
-                if int(content_length) > max_bytes:
-                    return None
+                expected = int(content_length)
             except ValueError:
-                pass
-
-        collected = bytearray()
-        async for chunk in response.aiter_bytes():
-            collected.extend(chunk)
-            if len(collected) > max_bytes:
+                expected = 0
+            if expected > max_bytes:
+                if not truncatable:
+                    return None
+                expected = max_bytes
+
+        if expected and not response.headers.get("content-encoding"):
+            collected = bytearray(expected)
+        else:
+            collected = bytearray()
+        offset = 0
+        async for chunk in response.aiter_bytes(chunk_size=_READ_CHUNK_SIZE):
+            end = offset + len(chunk)
+            if end > max_bytes:
                 await response.aclose()
-                return None
+                if not truncatable:
+                    return None
+                collected[offset:max_bytes] = chunk[:max_bytes - offset]
+                offset = max_bytes
+                break
+            collected[offset:end] = chunk
+            offset = end
+
+        if offset < len(collected):
+            del collected[offset:]
         return bytes(collected)
 
     async def _fetch_response_bytes(
@@ -236,7 +402,23 @@ class WebFetcher:
         headers: dict,
         max_bytes: int,
     ) -> tuple[int, httpx.Headers, Optional[bytes]]:
+        if max_bytes > 0 and url[-4:].lower() == ".pdf":
+            try:
+                head = await self._client.head(url, headers=headers)
+            except httpx.HTTPError:
+                head = None
+            if head is not None and head.status_code == 200:
+                try:
+                    declared = int(head.headers.get("content-length") or 0)
+                except ValueError:
+                    declared = 0
+                if declared > max_bytes:
+                    return head.status_code, head.headers, None
+
         async with self._client.stream("GET", url, headers=headers) as response:
+            content_type = (response.headers.get("content-type") or "").lower()
+            if response.status_code != 200 or self._is_rejected_content_type(content_type, url):
+                return response.status_code, response.headers, b""
             content = await self._read_response_bytes(response, max_bytes)
             return response.status_code, response.headers, content
 
@@ -252,11 +434,30 @@ class WebFetcher:
             if fmt.get("fileUrl")
         }
 
-        for fmt in preferred:
-            file_url = by_format.get(fmt)
-            if not file_url:
-                continue
-            result = await self.fetch_url(file_url, max_length=max_length)
+        urls = [by_format[fmt] for fmt in preferred if by_format.get(fmt)]
+        for url in urls:
+            cached = _fetch_result_cache.get((url, max_length, True))
+            if cached is not None and cached.get("text"):
+                return copy.deepcopy(cached)
+
+        async def fetch_uncached(url: str) -> dict:
+            result = await self._fetch_url_uncached(url, max_length, True)
+            if result.get("text") and not result.get("error"):
+                _fetch_result_cache[(url, max_length, True)] = copy.deepcopy(result)
+            return result
+
+        tasks = [asyncio.create_task(fetch_uncached(url)) for url in urls[:2]]
+        try:
+            for task in tasks:
+                result = await task
+                if result.get("text"):
+                    return result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        for url in urls[2:]:
+            result = await self.fetch_url(url, max_length=max_length)
             if result.get("text"):
                 return result
 
@@ -272,17 +473,16 @@ class WebFetcher:
             return [], 0
 
         max_bytes = self.settings.fetch_max_response_bytes
-        status, headers, content = await self._fetch_response_bytes(
-            normalized_url,
-            headers=self._build_headers("bot"),
-            max_bytes=max_bytes,
-        )
-        if status == 403:
+        for variant in self._header_variants(normalized_url):
             status, headers, content = await self._fetch_response_bytes(
                 normalized_url,
-                headers=self._build_headers("browser"),
+                headers=self._build_headers(variant),
                 max_bytes=max_bytes,
             )
+            if status == 403 and variant == "bot":
+                self._mark_bot_blocked(normalized_url)
+                continue
+            break
         if status != 200 or content is None:
             return [], 0
 
@@ -290,7 +490,7 @@ class WebFetcher:
         if not self._is_probably_pdf(content_type, normalized_url, content):
             return [], 0
 
-        images, skipped = await asyncio.to_thread(
+        images, skipped = await run_pdf_task(
             extract_pdf_images_sync,
             content,
         )
@@ -307,6 +507,30 @@ class WebFetcher:
         self,
         url: str,
         max_length: Optional[int] = 15000,
+        extract_images: bool = True,
+    ) -> dict:
+        key = (url, max_length, extract_images)
+        cached = _fetch_result_cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        pending = _pending_fetches.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._fetch_url_uncached(url, max_length, extract_images)
+            )
+            _pending_fetches[key] = pending
+            pending.add_done_callback(lambda _: _pending_fetches.pop(key, None))
+        result = await asyncio.shield(pending)
+        if not result.get("error"):
+            _fetch_result_cache[key] = result
+        return copy.deepcopy(result)
+
+    async def _fetch_url_uncached(
+        self,
+        url: str,
+        max_length: Optional[int],
+        extract_images: bool,
     ) -> dict:
         logger.info(f"Fetching URL content: {url}")
 
@@ -333,7 +557,7 @@ class WebFetcher:
                 should_retry = False
                 retry_wait: Optional[float] = None
 
-                for variant in ("bot", "browser"):
+                for variant in self._header_variants(normalized_url):
                     try:
                         status, headers, raw_content = await self._fetch_response_bytes(
                             normalized_url,
@@ -350,6 +574,7 @@ class WebFetcher:
                         break
 
                     if status == 403 and variant == "bot":
+                        self._mark_bot_blocked(normalized_url)
                         continue
 
                     if raw_content is None:
@@ -387,19 +612,24 @@ class WebFetcher:
                         result["content_type"] = content_type or "application/pdf"
                         result["content_format"] = "pdf"
                         result["pdf_url"] = normalized_url
-                        pdf_text = await asyncio.to_thread(
-                            extract_pdf_text_sync,
-                            raw_content,
-                            max_length,
-                        )
-                        images = []
-                        skipped = 0
-                        should_extract_images = self.settings.pdf_extract_images or not pdf_text
-                        if should_extract_images:
-                            images, skipped = await asyncio.to_thread(
-                                extract_pdf_images_sync,
+                        if extract_images and self.settings.pdf_extract_images:
+                            pdf_text, (images, skipped) = await asyncio.gather(
+                                run_pdf_task(extract_pdf_text_sync, raw_content, max_length),
+                                run_pdf_task(extract_pdf_images_sync, raw_content),
+                            )
+                        else:
+                            pdf_text = await run_pdf_task(
+                                extract_pdf_text_sync,
                                 raw_content,
+                                max_length,
                             )
+                            images = []
+                            skipped = 0
+                            if extract_images and not pdf_text:
+                                images, skipped = await run_pdf_task(
+                                    extract_pdf_images_sync,
+                                    raw_content,
+                                )
 
                         logger.info(
                             "PDF extracted from %s: text=%s images=%s skipped=%s",
@@ -451,54 +681,26 @@ class WebFetcher:
                     else:
                         result["content_format"] = "text"
 
-                    encoding = "utf-8"
-                    charset_match = re.search(r"charset=([\\w-]+)", content_type)
-                    if charset_match:
-                        encoding = charset_match.group(1)
-                    html = raw_content.decode(encoding, errors="replace")
-
-                    title_match = re.search(
-                        r'<title[^>]*>(.*?)</title>',
-                        html,
-                        re.IGNORECASE | re.DOTALL,
-                    )
-                    if title_match:
-                        result["title"] = html_to_text(
-                            title_match.group(1),
-                            max_length=200,
-                        )
-
-                    main_content = html
-
-                    main_patterns = [
-                        r'<main[^>]*>(.*?)</main>',
-                        r'<article[^>]*>(.*?)</article>',
-                        r'<div[^>]*class="[^"]*content[^"]*"[^>]*>(.*?)</div>',
-                        r'<div[^>]*id="[^"]*content[^"]*"[^>]*>(.*?)</div>',
-                    ]
-
-                    for pattern in main_patterns:
-                        match = re.search(
-                            pattern,
-                            html,
-                            re.IGNORECASE | re.DOTALL,
-                        )
-                        if match and len(match.group(1)) > 500:
-                            main_content = match.group(1)
-                            break
+                    charset = content_type.partition("charset=")[2]
+                    encoding = charset.split(";", 1)[0].strip().strip("\"'") or "utf-8"
+                    html = raw_content.decode(_resolve_encoding(encoding), errors="replace")
 
+                    title, main_content = self._extract_title_and_main(html)
+                    if title:
+                        result["title"] = title
                     result["text"] = html_to_text(main_content, max_length)
                     return result
 
                 if should_retry and attempt < max_attempts - 1:
                     wait_time = retry_wait if retry_wait is not None else backoff
+                    wait_time = min(wait_time, self.settings.max_backoff) * random.uniform(0.8, 1.2)
                     logger.warning(
                         "Fetch attempt %s failed. Retrying in %.2fs.",
                         attempt + 1,
                         wait_time,
                     )
                     await asyncio.sleep(wait_time)
-                    backoff = min(backoff * 2, 30.0)
+                    backoff = min(backoff * 2, self.settings.max_backoff)
                     continue
 
             if last_error:
@@ -542,15 +744,14 @@ class WebFetcher:
 
         try:
             api_url = f"https://api.regulations.gov/v4/documents/{document_id}"
-            headers = {
-                "X-Api-Key": self.settings.gov_api_key,
-                "Accept": "application/json",
-            }
-
-            response = await self._client.get(api_url, headers=headers, timeout=self.timeout)
+            response = await self._client.get(
+                api_url,
+                headers=self._api_headers,
+                timeout=self.timeout,
+            )
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 attrs = data.get("data", {}).get("attributes", {}) or {}
                 file_formats = attrs.get("fileFormats") or []
             else:
@@ -585,6 +786,7 @@ class WebFetcher:
                     pdf_url = fmt["fileUrl"]
                     break
 
+        extracted_pdf_urls = set()
         file_result = None
         if isinstance(file_formats, list) and file_formats:
             file_result = await self._fetch_best_file_format(
@@ -603,6 +805,7 @@ class WebFetcher:
                 result["content_type"] = file_result.get("content_type")
             if file_result.get("pdf_url"):
                 result["pdf_url"] = file_result.get("pdf_url")
+                extracted_pdf_urls.add(file_result["pdf_url"])
             if file_result.get("images"):
                 images = file_result.get("images") or images
                 images_skipped = file_result.get("images_skipped", images_skipped)
@@ -620,12 +823,14 @@ class WebFetcher:
                 result["content_format"] = fallback.get("content_format")
             if fallback.get("content_type") and not result.get("content_type"):
                 result["content_type"] = fallback.get("content_type")
-            if fallback.get("pdf_url") and not result.get("pdf_url"):
-                result["pdf_url"] = fallback.get("pdf_url")
+            if fallback.get("pdf_url"):
+                extracted_pdf_urls.add(fallback["pdf_url"])
+                if not result.get("pdf_url"):
+                    result["pdf_url"] = fallback.get("pdf_url")
             if not result.get("error") and fallback.get("error"):
                 result["error"] = fallback.get("error")
 
-        if not images and pdf_url:
+        if not images and pdf_url and pdf_url.strip() not in extracted_pdf_urls:
             pdf_images, skipped = await self._fetch_pdf_images_only(pdf_url)
             if pdf_images:
                 images = pdf_images
@@ -1,6 +1,6 @@
 import json
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
 
 
@@ -81,6 +81,19 @@ class Settings(BaseSettings):
 
     max_retries: int = 3
     initial_backoff: float = 1.0
+    max_backoff: float = 30.0
+
+    http_max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    http_max_keepalive: int = int(os.getenv("HTTP_MAX_KEEPALIVE", "30"))
+    http_keepalive_expiry: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0"))
+    http_host_concurrency: int = int(os.getenv("HTTP_HOST_CONCURRENCY", "10"))
+    http_host_concurrency_overrides: dict[str, int] = {
+        "api.regulations.gov": 5,
+        "api.govinfo.gov": 5,
+        "api.congress.gov": 5,
+    }
+    circuit_breaker_threshold: int = 5
+    circuit_breaker_cooldown: float = 30.0
 
     rag_collection: str = os.getenv("RAG_COLLECTION", "pdf_memory")
     rag_persist_dir: str = os.getenv("RAG_PERSIST_DIR", "./chroma")
@@ -91,13 +104,17 @@ class Settings(BaseSettings):
 
     app_api_key: str = os.getenv("APP_API_KEY", "")
     rate_limit_per_minute: int = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
+    rate_limit_max_clients: int = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
 
     fetch_allowed_domains_raw: str = os.getenv("FETCH_ALLOWED_DOMAINS", ".gov,.mil")
     allow_local_fetch: bool = _get_bool_env("ALLOW_LOCAL_FETCH", False)
     fetch_max_response_bytes: int = int(os.getenv("FETCH_MAX_RESPONSE_BYTES", "10000000"))
     pdf_extract_images: bool = _get_bool_env("PDF_EXTRACT_IMAGES", False)
+    pdf_process_workers: int = int(
+        os.getenv("PDF_PROCESS_WORKERS", str(min(4, os.cpu_count() or 1)))
+    )
 
-    @property
+    @cached_property
     def fetch_allowed_domains(self) -> list[str]:
         value = self.fetch_allowed_domains_raw
         if value is None or value == "":
@@ -6,11 +6,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import router
-from .models.database import init_db
+from .models.database import close_db, init_db
 from .config import get_settings
 from .clients.base import BaseAPIClient
 from .clients.web_fetcher import WebFetcher
 from .clients.govinfo import GovInfoClient
+from .clients.pdf_utils import shutdown_pdf_executor
+from .services.pdf_memory import close_pdf_memory_clients
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,6 +43,9 @@ async def lifespan(app: FastAPI):
     await BaseAPIClient.close_shared_clients()
     await WebFetcher.close_shared_clients()
     await GovInfoClient.close_shared_clients()
+    await close_pdf_memory_clients()
+    shutdown_pdf_executor()
+    await close_db()
 
 
 app = FastAPI(
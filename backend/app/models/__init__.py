@@ -22,11 +22,13 @@ from .schemas import (
 )
 from .database import (
     init_db,
+    close_db,
     get_session_by_id,
     create_session,
     update_session_response_id,
     delete_session,
     add_message,
+    add_message_with_sources,
     get_messages,
     save_sources,
     list_sessions,
@@ -55,11 +57,13 @@ __all__ = [
     "AssistantDeltaEvent",
     "DoneEvent",
     "init_db",
+    "close_db",
     "get_session_by_id",
     "create_session",
     "update_session_response_id",
     "delete_session",
     "add_message",
+    "add_message_with_sources",
     "get_messages",
     "save_sources",
     "list_sessions",
@@ -1,15 +1,20 @@
+import asyncio
 import os
 import sqlite3
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 import aiosqlite
+from cachetools import TTLCache
 
 from ..config import get_settings
 
 
+@lru_cache(maxsize=1)
 def _resolve_database_path() -> str:
     override = os.getenv("DATABASE_PATH")
     if override:
@@ -24,65 +29,160 @@ def _resolve_database_path() -> str:
     return "policy_radar.db"
 
 
-DATABASE_PATH = _resolve_database_path()
-
-
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+_session_list_cache: TTLCache = TTLCache(maxsize=16, ttl=5)
+_session_list_generation = 0
+
+
+def _invalidate_session_list() -> None:
+    global _session_list_generation
+    _session_list_generation += 1
+    _session_list_cache.clear()
+
+
+_connections: dict[tuple[int, bool], aiosqlite.Connection] = {}
+_connection_locks: dict[tuple[int, bool], asyncio.Lock] = {}
+
+
+async def _open_connection(read_only: bool) -> aiosqlite.Connection:
+    path = _resolve_database_path()
+    if read_only:
+        conn = await aiosqlite.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+    else:
+        conn = await aiosqlite.connect(path)
+    conn.row_factory = sqlite3.Row
+    await conn.execute("PRAGMA foreign_keys=ON")
+    await conn.execute("PRAGMA synchronous=NORMAL")
+    await conn.execute("PRAGMA temp_store=MEMORY")
+    await conn.execute("PRAGMA cache_size=-20000")
+    await conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+@asynccontextmanager
+async def _shared_connection(read_only: bool):
+    key = (id(asyncio.get_running_loop()), read_only)
+    lock = _connection_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        conn = _connections.get(key)
+        if conn is None:
+            conn = await _open_connection(read_only)
+            _connections[key] = conn
+        yield conn
+
+
 @asynccontextmanager
 async def db_session():
-    conn = await aiosqlite.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    try:
+    async with _shared_connection(read_only=False) as conn:
+        try:
+            yield conn
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            raise
+        finally:
+            _invalidate_session_list()
+
+
+@asynccontextmanager
+async def read_session():
+    async with _shared_connection(read_only=True) as conn:
         yield conn
-        await conn.commit()
-    except Exception:
-        await conn.rollback()
-        raise
+
+
+async def close_db() -> None:
+    loop_id = id(asyncio.get_running_loop())
+    for read_only in (False, True):
+        key = (loop_id, read_only)
+        conn = _connections.pop(key, None)
+        _connection_locks.pop(key, None)
+        if conn is not None:
+            await conn.close()
+
+
+_MESSAGES_TABLE = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE
+    );
+"""
+
+_SOURCES_TABLE = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT NOT NULL,
+        message_id INTEGER,
+        sources_json TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE,
+        FOREIGN KEY (message_id) REFERENCES messages(id) ON DELETE CASCADE
+    );
+"""
+
+
+async def _needs_cascade_migration(conn: aiosqlite.Connection) -> bool:
+    for table in ("messages", "sources"):
+        async with conn.execute(f"PRAGMA foreign_key_list({table})") as cursor:
+            rows = await cursor.fetchall()
+        if any(row["on_delete"] != "CASCADE" for row in rows):
+            return True
+    return False
+
+
+async def _migrate_cascade_fks(conn: aiosqlite.Connection) -> None:
+    await conn.execute("PRAGMA foreign_keys=OFF")
+    try:
+        await conn.executescript(
+            "BEGIN;"
+            + _MESSAGES_TABLE.format(name="messages_new")
+            + _SOURCES_TABLE.format(name="sources_new")
+            + """
+            INSERT INTO messages_new
+                SELECT * FROM messages WHERE session_id IN (SELECT session_id FROM sessions);
+            INSERT INTO sources_new
+                SELECT * FROM sources
+                WHERE session_id IN (SELECT session_id FROM sessions)
+                  AND (message_id IS NULL OR message_id IN (SELECT id FROM messages_new));
+            DROP TABLE sources;
+            DROP TABLE messages;
+            ALTER TABLE messages_new RENAME TO messages;
+            ALTER TABLE sources_new RENAME TO sources;
+            COMMIT;
+            """
+        )
     finally:
-        await conn.close()
+        await conn.execute("PRAGMA foreign_keys=ON")
 
 
 async def init_db() -> None:
     async with db_session() as conn:
-        await conn.execute(
+        await conn.execute("PRAGMA journal_mode=WAL")
+        if await _needs_cascade_migration(conn):
+            await _migrate_cascade_fks(conn)
+        await conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS sessions (
                 session_id TEXT PRIMARY KEY,
                 previous_response_id TEXT,
                 created_at TEXT NOT NULL
-            )
-            """
-        )
-
-        await conn.execute(
+            );
             """
-            CREATE TABLE IF NOT EXISTS messages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                role TEXT NOT NULL,
-                content TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-            )
-            """
-        )
-
-        await conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sources (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                message_id INTEGER,
-                sources_json TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id),
-                FOREIGN KEY (message_id) REFERENCES messages(id)
-            )
+            + _MESSAGES_TABLE.format(name="messages")
+            + _SOURCES_TABLE.format(name="sources")
+            + """
+            CREATE INDEX IF NOT EXISTS idx_messages_session_id ON messages(session_id, id);
+            CREATE INDEX IF NOT EXISTS idx_messages_session_role ON messages(session_id, role, id);
+            CREATE INDEX IF NOT EXISTS idx_sources_session ON sources(session_id, message_id);
             """
         )
+        await conn.execute("PRAGMA optimize")
 
 
 async def create_session() -> str:
@@ -99,7 +199,7 @@ async def create_session() -> str:
 
 
 async def get_session_by_id(session_id: str) -> Optional[dict]:
-    async with db_session() as conn:
+    async with read_session() as conn:
         async with conn.execute(
             "SELECT session_id, previous_response_id, created_at FROM sessions WHERE session_id = ?",
             (session_id,),
@@ -125,8 +225,7 @@ async def update_session_response_id(session_id: str, response_id: str) -> None:
 
 async def delete_session(session_id: str) -> bool:
     async with db_session() as conn:
-        await conn.execute("DELETE FROM sources WHERE session_id = ?", (session_id,))
-        await conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        await conn.execute("BEGIN IMMEDIATE")
         cursor = await conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
         return cursor.rowcount > 0
 
@@ -142,8 +241,30 @@ async def add_message(session_id: str, role: str, content: str) -> int:
         return cursor.lastrowid
 
 
-async def get_messages(session_id: str) -> list[dict]:
+async def add_message_with_sources(
+    session_id: str,
+    role: str,
+    content: str,
+    sources_json: Optional[str],
+) -> int:
+    created_at = _utc_now_iso()
+
     async with db_session() as conn:
+        cursor = await conn.execute(
+            "INSERT INTO messages (session_id, role, content, created_at) VALUES (?, ?, ?, ?)",
+            (session_id, role, content, created_at),
+        )
+        message_id = cursor.lastrowid
+        if sources_json:
+            await conn.execute(
+                "INSERT INTO sources (session_id, message_id, sources_json, created_at) VALUES (?, ?, ?, ?)",
+                (session_id, message_id, sources_json, created_at),
+            )
+        return message_id
+
+
+async def get_messages(session_id: str) -> list[dict]:
+    async with read_session() as conn:
         async with conn.execute(
             "SELECT id, session_id, role, content, created_at FROM messages WHERE session_id = ? ORDER BY id",
             (session_id,),
@@ -182,34 +303,34 @@ async def update_message_content(session_id: str, message_id: int, content: str)
 
 
 async def list_sessions(limit: int = 50) -> list[dict]:
-    async with db_session() as conn:
+    cached = _session_list_cache.get(limit)
+    if cached is not None:
+        return list(cached)
+
+    generation = _session_list_generation
+    async with read_session() as conn:
         async with conn.execute(
             """
             SELECT
                 s.session_id,
                 s.created_at,
+                m.content AS last_message,
+                m.created_at AS last_message_at,
                 (
                     SELECT content
-                    FROM messages m
-                    WHERE m.session_id = s.session_id
-                    ORDER BY m.id DESC
-                    LIMIT 1
-                ) AS last_message,
-                (
-                    SELECT created_at
-                    FROM messages m
-                    WHERE m.session_id = s.session_id
-                    ORDER BY m.id DESC
-                    LIMIT 1
-                ) AS last_message_at,
-                (
-                    SELECT content
-                    FROM messages m
-                    WHERE m.session_id = s.session_id AND m.role = 'user'
-                    ORDER BY m.id ASC
+                    FROM messages t
+                    WHERE t.session_id = s.session_id AND t.role = 'user'
+                    ORDER BY t.id ASC
                     LIMIT 1
                 ) AS title
             FROM sessions s
+            LEFT JOIN messages m ON m.id = (
+                SELECT id
+                FROM messages l
+                WHERE l.session_id = s.session_id
+                ORDER BY l.id DESC
+                LIMIT 1
+            )
             ORDER BY COALESCE(last_message_at, s.created_at) DESC
             LIMIT ?
             """,
@@ -217,20 +338,23 @@ async def list_sessions(limit: int = 50) -> list[dict]:
         ) as cursor:
             rows = await cursor.fetchall()
 
-        return [
-            {
-                "session_id": row["session_id"],
-                "created_at": row["created_at"],
-                "last_message": row["last_message"],
-                "last_message_at": row["last_message_at"],
-                "title": row["title"],
-            }
-            for row in rows
-        ]
+    sessions = [
+        {
+            "session_id": row["session_id"],
+            "created_at": row["created_at"],
+            "last_message": row["last_message"],
+            "last_message_at": row["last_message_at"],
+            "title": row["title"],
+        }
+        for row in rows
+    ]
+    if generation == _session_list_generation:
+        _session_list_cache[limit] = sessions
+    return list(sessions)
 
 
 async def get_sources(session_id: str) -> list[dict]:
-    async with db_session() as conn:
+    async with read_session() as conn:
         async with conn.execute(
             "SELECT message_id, sources_json FROM sources WHERE session_id = ?",
             (session_id,),
@@ -1,7 +1,9 @@
-import asyncio
+import hmac
+import math
 import time
 from typing import Optional
 
+from cachetools import TTLCache
 from fastapi import HTTPException, Request
 
 from .config import get_settings
@@ -27,16 +29,20 @@ async def require_api_key(request: Request) -> None:
         or _extract_bearer_token(request.headers.get("authorization"))
         or request.query_params.get("api_key")
     )
-    if not provided or provided != expected:
+    if not provided or not hmac.compare_digest(provided.encode(), expected.encode()):
         raise HTTPException(status_code=401, detail="Missing or invalid API key.")
 
 
 class RateLimiter:
-    def __init__(self, limit_per_minute: int = 60):
+    def __init__(self, limit_per_minute: int = 60, max_clients: int = 10000):
         self.limit_per_minute = limit_per_minute
         self.window_seconds = 60
-        self._lock = asyncio.Lock()
-        self._buckets: dict[str, tuple[float, int]] = {}
+        self._interval = self.window_seconds / limit_per_minute if limit_per_minute > 0 else 0.0
+        self._buckets: TTLCache = TTLCache(
+            maxsize=max(max_clients, 1),
+            ttl=self.window_seconds,
+            timer=time.monotonic,
+        )
 
     def _get_client_key(self, request: Request) -> str:
         forwarded = request.headers.get("x-forwarded-for")
@@ -50,26 +56,21 @@ class RateLimiter:
         if self.limit_per_minute <= 0:
             return
 
-        now = time.time()
+        now = time.monotonic()
         key = self._get_client_key(request)
 
-        async with self._lock:
-            window_start, count = self._buckets.get(key, (now, 0))
-            if now - window_start >= self.window_seconds:
-                window_start = now
-                count = 0
+        tat = max(self._buckets.get(key, now), now) + self._interval
+        if tat - now > self.window_seconds:
+            retry_after = math.ceil(tat - now - self.window_seconds)
+            raise HTTPException(
+                status_code=429,
+                detail={
+                    "message": "Rate limit exceeded. Please try again later.",
+                    "retry_after": max(retry_after, 1),
+                },
+            )
 
-            if count >= self.limit_per_minute:
-                retry_after = int(self.window_seconds - (now - window_start))
-                raise HTTPException(
-                    status_code=429,
-                    detail={
-                        "message": "Rate limit exceeded. Please try again later.",
-                        "retry_after": max(retry_after, 1),
-                    },
-                )
-
-            self._buckets[key] = (window_start, count + 1)
+        self._buckets[key] = tat
 
 
 _RATE_LIMITER: Optional[RateLimiter] = None
@@ -79,7 +80,10 @@ def get_rate_limiter() -> RateLimiter:
     global _RATE_LIMITER
     if _RATE_LIMITER is None:
         settings = get_settings()
-        _RATE_LIMITER = RateLimiter(limit_per_minute=settings.rate_limit_per_minute)
+        _RATE_LIMITER = RateLimiter(
+            limit_per_minute=settings.rate_limit_per_minute,
+            max_clients=settings.rate_limit_max_clients,
+        )
     return _RATE_LIMITER
 
 
@@ -6,12 +6,14 @@ from typing import Optional, AsyncGenerator
 import httpx
 from openai import AsyncOpenAI
 
-from ..config import get_settings
+from ..config import Settings, get_settings
 from ..models.schemas import SourceItem, Step, SourceSelection, EmbeddingConfig
 from .tool_executor import ToolExecutor, get_tool_label
 
 logger = logging.getLogger(__name__)
 
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 MAX_TOOL_TEXT_CHARS = 20000
 MAX_TOOL_IMAGES = 2
 MAX_IMAGE_BYTES = 200_000
@@ -509,6 +511,36 @@ TOOLS = [
 ]
 
 
+_TOOL_CALL_CONCURRENCY = 8
+
+
+_configured_sources_cache: dict[int, tuple[Settings, frozenset[str]]] = {}
+
+
+def _configured_sources(settings: Settings) -> frozenset[str]:
+    cached = _configured_sources_cache.get(id(settings))
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+
+    configured = set(SOURCE_DISPLAY_NAMES.keys())
+
+    if not settings.gov_api_key:
+        configured.discard("regulations")
+        configured.discard("govinfo")
+        configured.discard("congress")
+
+    if not (settings.searchgov_affiliate and settings.searchgov_access_key):
+        configured.discard("searchgov")
+
+    result = frozenset(configured)
+    _configured_sources_cache.clear()
+    _configured_sources_cache[id(settings)] = (settings, result)
+    return result
+
+
+_AVAILABLE_TOOLS_CACHE: dict[tuple[str, Optional[frozenset[str]]], list[dict]] = {}
+_CHAT_TOOLS_CACHE: dict[tuple[str, frozenset[str]], list[dict]] = {}
+
 
 class OpenAIService:
     def __init__(
@@ -568,6 +600,124 @@ class OpenAIService:
         cancel_task.cancel()
         return await task
 
+    async def _iterate_with_cancel(self, stream, cancel_event: Optional[asyncio.Event]):
+        try:
+            if not cancel_event:
+                async for event in stream:
+                    yield event
+                return
+
+            iterator = stream.__aiter__()
+            cancel_task = asyncio.create_task(cancel_event.wait())
+            next_task = None
+            try:
+                while True:
+                    next_task = asyncio.ensure_future(iterator.__anext__())
+                    done, _ = await asyncio.wait(
+                        {next_task, cancel_task},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if cancel_task in done:
+                        raise asyncio.CancelledError()
+                    try:
+                        event = next_task.result()
+                    except StopAsyncIteration:
+                        return
+                    yield event
+            finally:
+                cancel_task.cancel()
+                if next_task is not None:
+                    next_task.cancel()
+        finally:
+            await stream.close()
+
+    async def _stream_chat_completion(
+        self,
+        request: dict,
+        cancel_event: Optional[asyncio.Event],
+    ) -> AsyncGenerator[dict, None]:
+        stream = await self._await_with_cancel(
+            self.client.chat.completions.create(stream=True, **request),
+            cancel_event,
+        )
+
+        response_id = ""
+        content_parts: list[str] = []
+        tool_calls: dict[int, dict] = {}
+        async for chunk in self._iterate_with_cancel(stream, cancel_event):
+            response_id = chunk.id or response_id
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content_parts.append(delta.content)
+                yield {"delta": delta.content}
+            for tool_delta in delta.tool_calls or []:
+                entry = tool_calls.setdefault(
+                    tool_delta.index,
+                    {"id": "", "type": "function", "function": {"name": "", "arguments": ""}},
+                )
+                if tool_delta.id:
+                    entry["id"] = tool_delta.id
+                if tool_delta.function:
+                    if tool_delta.function.name:
+                        entry["function"]["name"] += tool_delta.function.name
+                    if tool_delta.function.arguments:
+                        entry["function"]["arguments"] += tool_delta.function.arguments
+
+        message = {"role": "assistant", "content": "".join(content_parts) or None}
+        if tool_calls:
+            message["tool_calls"] = [tool_calls[index] for index in sorted(tool_calls)]
+        yield {"message": message, "response_id": response_id}
+
+    async def _stream_response(
+        self,
+        request: dict,
+        cancel_event: Optional[asyncio.Event],
+    ) -> AsyncGenerator[dict, None]:
+        stream = await self._await_with_cancel(
+            self.client.responses.create(stream=True, **request),
+            cancel_event,
+        )
+
+        response = None
+        async for event in self._iterate_with_cancel(stream, cancel_event):
+            if event.type == "response.output_text.delta":
+                yield {"delta": event.delta}
+            elif event.type in ("response.completed", "response.incomplete"):
+                response = event.response
+            elif event.type == "response.failed":
+                error = event.response.error
+                raise RuntimeError(error.message if error else "Response failed.")
+            elif event.type == "error":
+                raise RuntimeError(event.message)
+
+        if response is None:
+            raise RuntimeError("Response stream ended before completion.")
+        yield {"response": response}
+
+    async def _run_tool_calls(
+        self,
+        tool_calls: list[tuple[str, dict]],
+    ) -> AsyncGenerator[tuple[int, dict, Optional[dict]], None]:
+        semaphore = asyncio.Semaphore(_TOOL_CALL_CONCURRENCY)
+
+        async def run(index: int, tool_name: str, args: dict):
+            async with semaphore:
+                result, preview = await self.tool_executor.execute_tool(tool_name, args)
+            return index, result, preview
+
+        tasks = [
+            asyncio.create_task(run(index, tool_name, args))
+            for index, (tool_name, args) in enumerate(tool_calls)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def _truncate_for_model(self, text: str) -> tuple[str, bool]:
         if not text or len(text) <= MAX_TOOL_TEXT_CHARS:
             return text, False
@@ -744,19 +894,8 @@ Search context:
 
 Please search for relevant information and provide a comprehensive answer with citations."""
 
-    def _get_configured_sources(self) -> set[str]:
-        settings = get_settings()
-        configured = set(SOURCE_DISPLAY_NAMES.keys())
-
-        if not settings.gov_api_key:
-            configured.discard("regulations")
-            configured.discard("govinfo")
-            configured.discard("congress")
-
-        if not (settings.searchgov_affiliate and settings.searchgov_access_key):
-            configured.discard("searchgov")
-
-        return configured
+    def _get_configured_sources(self) -> frozenset[str]:
+        return _configured_sources(get_settings())
 
     def _filter_tools_for_sources(self, tools: list[dict], selected_sources: set[str]) -> list[dict]:
         filtered = []
@@ -813,7 +952,7 @@ Please search for relevant information and provide a comprehensive answer with c
         except Exception:
             pass
 
-        match = re.search(r"\{.*\}", text, flags=re.DOTALL)
+        match = _JSON_OBJECT_RE.search(text)
         if not match:
             return None
         try:
@@ -1100,6 +1239,24 @@ Please search for relevant information and provide a comprehensive answer with c
             args["days"] = days
 
     def _get_available_tools(self, mode: str, selected_sources: Optional[set[str]] = None) -> list[dict]:
+        key = (mode, frozenset(selected_sources) if selected_sources is not None else None)
+        tools = _AVAILABLE_TOOLS_CACHE.get(key)
+        if tools is None:
+            tools = self._build_available_tools(mode, selected_sources)
+            _AVAILABLE_TOOLS_CACHE[key] = tools
+        return tools
+
+    def _get_chat_tools(self, mode: str, selected_sources: set[str]) -> list[dict]:
+        key = (mode, frozenset(selected_sources))
+        tools = _CHAT_TOOLS_CACHE.get(key)
+        if tools is None:
+            tools = self._convert_tools_for_chat_completions(
+                self._get_available_tools(mode, selected_sources=selected_sources)
+            )
+            _CHAT_TOOLS_CACHE[key] = tools
+        return tools
+
+    def _build_available_tools(self, mode: str, selected_sources: Optional[set[str]]) -> list[dict]:
         fetch_url_tool = [t for t in TOOLS if t["name"] == "fetch_url_content"]
         memory_tool = [t for t in TOOLS if t["name"] == "search_pdf_memory"]
 
@@ -1179,8 +1336,7 @@ Please search for relevant information and provide a comprehensive answer with c
             selected_sources=selected_sources,
             auto_rationale=auto_rationale,
         )
-        available_tools = self._get_available_tools(mode, selected_sources=selected_sources)
-        chat_tools = self._convert_tools_for_chat_completions(available_tools)
+        chat_tools = self._get_chat_tools(mode, selected_sources)
 
         messages = [
             {"role": "system", "content": SYSTEM_INSTRUCTIONS},
@@ -1205,8 +1361,8 @@ Please search for relevant information and provide a comprehensive answer with c
             tool_calls = response.choices[0].message.tool_calls
             messages.append(response.choices[0].message)
 
+            pending_calls = []
             for call in tool_calls:
-                await self._check_cancel(cancel_event)
                 step_counter += 1
                 step_id = str(step_counter)
                 tool_name = call.function.name
@@ -1222,8 +1378,14 @@ Please search for relevant information and provide a comprehensive answer with c
                     args=args,
                 )
                 steps.append(step)
+                pending_calls.append((call, tool_name, args, step))
 
-                result, preview = await self.tool_executor.execute_tool(tool_name, args)
+            await self._check_cancel(cancel_event)
+            tool_messages: list[Optional[dict]] = [None] * len(pending_calls)
+            async for index, result, preview in self._run_tool_calls(
+                [(tool_name, args) for _, tool_name, args, _ in pending_calls]
+            ):
+                call, tool_name, args, step = pending_calls[index]
                 safe_result, _ = self._prepare_tool_output(tool_name, result)
 
                 step.status = "done" if "error" not in safe_result else "error"
@@ -1231,11 +1393,12 @@ Please search for relevant information and provide a comprehensive answer with c
                 if tool_name == "search_pdf_memory":
                     step.label = self._format_pdf_search_label(args.get("query", ""), preview)
 
-                messages.append({
+                tool_messages[index] = {
                     "role": "tool",
                     "tool_call_id": call.id,
                     "content": json.dumps(safe_result),
-                })
+                }
+            messages.extend(tool_messages)
 
             await self._check_cancel(cancel_event)
             response = await self._await_with_cancel(
@@ -1311,36 +1474,46 @@ Please search for relevant information and provide a comprehensive answer with c
             selected_sources=selected_sources,
             auto_rationale=auto_rationale,
         )
-        available_tools = self._get_available_tools(mode, selected_sources=selected_sources)
-        chat_tools = self._convert_tools_for_chat_completions(available_tools)
+        chat_tools = self._get_chat_tools(mode, selected_sources)
 
         messages = [
             {"role": "system", "content": SYSTEM_INSTRUCTIONS},
             {"role": "user", "content": formatted_message}
         ]
+        request = {
+            "model": model_to_use,
+            "messages": messages,
+            "tools": chat_tools if chat_tools else None,
+            "tool_choice": "auto" if chat_tools else None,
+        }
 
-        await self._check_cancel(cancel_event)
-        response = await self._await_with_cancel(
-            self.client.chat.completions.create(
-                model=model_to_use,
-                messages=messages,
-                tools=chat_tools if chat_tools else None,
-                tool_choice="auto" if chat_tools else None,
-            ),
-            cancel_event,
-        )
-
-        while response.choices[0].message.tool_calls:
+        response_id = ""
+        while True:
             await self._check_cancel(cancel_event)
-            tool_calls = response.choices[0].message.tool_calls
-            messages.append(response.choices[0].message)
+            final_text = ""
+            message = None
+            async for item in self._stream_chat_completion(request, cancel_event):
+                if "delta" in item:
+                    final_text += item["delta"]
+                    yield {
+                        "event": "assistant_delta",
+                        "data": {"delta": item["delta"]}
+                    }
+                else:
+                    message = item["message"]
+                    response_id = item["response_id"]
 
+            tool_calls = message.get("tool_calls") if message else None
+            if not tool_calls:
+                break
+            messages.append(message)
+
+            pending_calls = []
             for call in tool_calls:
-                await self._check_cancel(cancel_event)
                 step_counter += 1
                 step_id = str(step_counter)
-                tool_name = call.function.name
-                args = json.loads(call.function.arguments)
+                tool_name = call["function"]["name"]
+                args = json.loads(call["function"]["arguments"])
 
                 self._apply_days_default(tool_name, args, days)
 
@@ -1354,8 +1527,14 @@ Please search for relevant information and provide a comprehensive answer with c
                         "args": args,
                     }
                 }
+                pending_calls.append((call, step_id, tool_name, args))
 
-                result, preview = await self.tool_executor.execute_tool(tool_name, args)
+            await self._check_cancel(cancel_event)
+            tool_messages: list[Optional[dict]] = [None] * len(pending_calls)
+            async for index, result, preview in self._run_tool_calls(
+                [(tool_name, args) for _, _, tool_name, args in pending_calls]
+            ):
+                call, step_id, tool_name, args = pending_calls[index]
                 safe_result, _ = self._prepare_tool_output(tool_name, result)
 
                 label_override = None
@@ -1372,33 +1551,12 @@ Please search for relevant information and provide a comprehensive answer with c
                     }
                 }
 
-                messages.append({
+                tool_messages[index] = {
                     "role": "tool",
-                    "tool_call_id": call.id,
+                    "tool_call_id": call["id"],
                     "content": json.dumps(safe_result),
-                })
-
-            await self._check_cancel(cancel_event)
-            response = await self._await_with_cancel(
-                self.client.chat.completions.create(
-                    model=model_to_use,
-                    messages=messages,
-                    tools=chat_tools if chat_tools else None,
-                    tool_choice="auto" if chat_tools else None,
-                ),
-                cancel_event,
-            )
-
-        final_text = response.choices[0].message.content or ""
-        chunk_size = 50
-        for i in range(0, len(final_text), chunk_size):
-            await self._check_cancel(cancel_event)
-            chunk = final_text[i:i + chunk_size]
-            yield {
-                "event": "assistant_delta",
-                "data": {"delta": chunk}
-            }
-            await asyncio.sleep(0.01)
+                }
+            messages.extend(tool_messages)
 
         sources = self.tool_executor.get_collected_sources()
 
@@ -1407,7 +1565,7 @@ Please search for relevant information and provide a comprehensive answer with c
             "data": {
                 "answer_text": final_text,
                 "sources": [s.model_dump() for s in sources],
-                "response_id": response.id or "",
+                "response_id": response_id,
                 "model": model_to_use,
             }
         }
@@ -1619,24 +1777,31 @@ Please search for relevant information and provide a comprehensive answer with c
         available_tools = self._get_available_tools(mode, selected_sources=selected_sources)
 
         input_messages = [{"role": "user", "content": formatted_message}]
+        request = {
+            "model": model_to_use,
+            "instructions": SYSTEM_INSTRUCTIONS,
+            "input": input_messages,
+            "tools": available_tools,
+            "parallel_tool_calls": False,
+            "previous_response_id": previous_response_id,
+        }
 
-        await self._check_cancel(cancel_event)
-        response = await self._await_with_cancel(
-            self.client.responses.create(
-                model=model_to_use,
-                instructions=SYSTEM_INSTRUCTIONS,
-                input=input_messages,
-                tools=available_tools,
-                parallel_tool_calls=False,
-                previous_response_id=previous_response_id,
-            ),
-            cancel_event,
-        )
-
-        current_response_id = response.id
-
+        current_response_id = previous_response_id
         while True:
             await self._check_cancel(cancel_event)
+            final_text = ""
+            response = None
+            async for item in self._stream_response(request, cancel_event):
+                if "delta" in item:
+                    final_text += item["delta"]
+                    yield {
+                        "event": "assistant_delta",
+                        "data": {"delta": item["delta"]}
+                    }
+                else:
+                    response = item["response"]
+            current_response_id = response.id
+
             function_calls = [
                 item for item in response.output
                 if item.type == "function_call"
@@ -1695,36 +1860,11 @@ Please search for relevant information and provide a comprehensive answer with c
                 if image_message:
                     function_outputs.append(image_message)
 
-            await self._check_cancel(cancel_event)
-            response = await self._await_with_cancel(
-                self.client.responses.create(
-                    model=model_to_use,
-                    instructions=SYSTEM_INSTRUCTIONS,
-                    input=function_outputs,
-                    tools=available_tools,
-                    parallel_tool_calls=False,
-                    previous_response_id=current_response_id,
-                ),
-                cancel_event,
-            )
-            current_response_id = response.id
-
-        final_text = ""
-        for item in response.output:
-            if item.type == "message":
-                for content in item.content:
-                    if content.type == "output_text":
-                        text = content.text
-                        chunk_size = 50
-                        for i in range(0, len(text), chunk_size):
-                            await self._check_cancel(cancel_event)
-                            chunk = text[i:i + chunk_size]
-                            yield {
-                                "event": "assistant_delta",
-                                "data": {"delta": chunk}
-                            }
-                            final_text += chunk
-                            await asyncio.sleep(0.01)
+            request = {
+                **request,
+                "input": function_outputs,
+                "previous_response_id": current_response_id,
+            }
 
         sources = self.tool_executor.get_collected_sources()
 
@@ -10,11 +10,17 @@ import httpx
 from chromadb.config import Settings as ChromaSettings
 from openai import OpenAI
 
+from ..clients.base import running_loop_id
 from ..config import get_settings
 from ..models.schemas import EmbeddingConfig
 
 logger = logging.getLogger(__name__)
 
+_SPACES_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_SLUG_RE = re.compile(r"[^a-z0-9_-]+")
+
+
 class DisabledPdfMemoryStore:
     def __init__(self) -> None:
         self.settings = get_settings()
@@ -56,6 +62,7 @@ class PdfMemoryStore:
         self._collections: dict[str, object] = {}
         self._openai = OpenAI(api_key=self.settings.openai_api_key)
         self._openai_clients: dict[tuple[str, str], OpenAI] = {}
+        self._http_clients: dict[Optional[int], httpx.AsyncClient] = {}
         self._local_models: dict[str, object] = {}
         self._local_model_lock = asyncio.Lock()
         self._lock = asyncio.Lock()
@@ -71,8 +78,8 @@ class PdfMemoryStore:
 
     def _normalize_text(self, text: str) -> str:
         text = text.replace("\r\n", "\n").replace("\r", "\n")
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _SPACES_RE.sub(" ", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
         return text.strip()
 
     def _chunk_text(self, text: str) -> list[str]:
@@ -111,7 +118,7 @@ class PdfMemoryStore:
         base = self._collection_base
         provider = (config.provider or "local").lower()
         model = (config.model or "default").lower()
-        slug = re.sub(r"[^a-z0-9_-]+", "-", f"{provider}-{model}").strip("-")
+        slug = _SLUG_RE.sub("-", f"{provider}-{model}").strip("-")
         digest = hashlib.sha1(f"{provider}:{model}".encode("utf-8")).hexdigest()[:8]
         name = f"{base}-{slug}-{digest}"
         return name[:120]
@@ -181,6 +188,22 @@ class PdfMemoryStore:
         self._openai_clients[key] = client
         return client
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        key = running_loop_id()
+        existing = self._http_clients.get(key)
+        if existing:
+            return existing
+        client = httpx.AsyncClient(timeout=60.0)
+        self._http_clients[key] = client
+        return client
+
+    async def close_http_clients(self) -> None:
+        loop_id = running_loop_id()
+        for client_loop, client in self._http_clients.items():
+            if client_loop in (loop_id, None):
+                await client.aclose()
+        self._http_clients = {}
+
     def _embed_openai_sync(
         self,
         texts: list[str],
@@ -259,10 +282,9 @@ class PdfMemoryStore:
             "options": {"wait_for_model": True},
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._get_http_client().post(url, headers=headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         if isinstance(data, dict) and data.get("error"):
             logger.error("Hugging Face embedding error: %s", data.get("error"))
@@ -515,3 +537,8 @@ def get_pdf_memory_store():
             logger.exception("Failed to initialize PDF memory store; disabling PDF memory: %s", exc)
             _PDF_MEMORY_STORE = DisabledPdfMemoryStore()
     return _PDF_MEMORY_STORE
+
+
+async def close_pdf_memory_clients() -> None:
+    if isinstance(_PDF_MEMORY_STORE, PdfMemoryStore):
+        await _PDF_MEMORY_STORE.close_http_clients()
@@ -3,7 +3,8 @@ import logging
 import re
 from typing import Optional
 
-from ..clients.regulations import RegulationsClient, get_date_range
+from ..clients.base import get_date_range
+from ..clients.regulations import RegulationsClient
 from ..clients.govinfo import GovInfoClient, build_govinfo_query
 from ..clients.web_fetcher import WebFetcher
 from ..clients.congress import CongressClient
@@ -18,6 +19,8 @@ from .pdf_memory import get_pdf_memory_store
 
 logger = logging.getLogger(__name__)
 
+_REGULATIONS_DOCUMENT_RE = re.compile(r"regulations\.gov/document/([^/?#]+)")
+
 
 class ToolExecutor:
     def __init__(
@@ -50,7 +53,7 @@ class ToolExecutor:
     def _extract_regulations_document_id(self, url: str) -> Optional[str]:
         if not url:
             return None
-        match = re.search(r"regulations\.gov/document/([^/?#]+)", url)
+        match = _REGULATIONS_DOCUMENT_RE.search(url)
         if match:
             return match.group(1)
         return None
@@ -93,6 +96,7 @@ class ToolExecutor:
             pdf_data = await self.web_fetcher.fetch_url(
                 url=pdf_url,
                 max_length=max_index_length,
+                extract_images=False,
             )
             if pdf_data.get("text"):
                 text_to_index = pdf_data.get("text", "")
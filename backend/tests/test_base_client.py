@@ -0,0 +1,75 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients import base
+from app.clients.base import BaseAPIClient
+
+
+def _client_with_handler(handler) -> BaseAPIClient:
+    client = BaseAPIClient(base_url="https://api.example.gov")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_etag_revalidation_reuses_cached_payload():
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"data": {"id": "doc"}}, headers={"ETag": '"v1"'})
+
+    client = _client_with_handler(handler)
+    url = "https://api.example.gov/documents/etag-test"
+
+    first = await client._request_with_retry("GET", url)
+    base._cache.clear()
+    second = await client._request_with_retry("GET", url)
+
+    assert first == second == {"data": {"id": "doc"}}
+    assert seen_headers == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_serves_stale_payload():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(200, json={"data": []})
+        return httpx.Response(503, text="unavailable")
+
+    client = _client_with_handler(handler)
+    url = "https://api.example.gov/documents/circuit-test"
+    BaseAPIClient._circuit_state.clear()
+
+    assert await client._request_with_retry("GET", url) == {"data": []}
+    base._cache.clear()
+    for _ in range(client.settings.circuit_breaker_threshold):
+        with pytest.raises(base.APIError):
+            await client._request_with_retry("GET", url)
+
+    upstream_calls = len(calls)
+    assert await client._request_with_retry("GET", url) == {"data": []}
+    assert len(calls) == upstream_calls
+    BaseAPIClient._circuit_state.clear()
+
+
+def test_host_semaphores_are_per_event_loop():
+    async def semaphore():
+        return BaseAPIClient(base_url="https://api.example.gov")._get_host_semaphore("api.example.gov")
+
+    loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+    try:
+        first, second = [loop.run_until_complete(semaphore()) for loop in loops]
+    finally:
+        for loop in loops:
+            loop.close()
+
+    assert first is not None and second is not None
+    assert first is not second
@@ -0,0 +1,31 @@
+import pytest
+
+from app.models import database
+
+
+@pytest.fixture
+def temp_database(monkeypatch, tmp_path):
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "test.db"))
+    database._resolve_database_path.cache_clear()
+    database._invalidate_session_list()
+    yield
+    database._resolve_database_path.cache_clear()
+    database._invalidate_session_list()
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_cache_invalidated_on_write(temp_database):
+    await database.init_db()
+    try:
+        assert await database.list_sessions(limit=5) == []
+
+        session_id = await database.create_session()
+        await database.add_message(session_id, "user", "cache check")
+        sessions = await database.list_sessions(limit=5)
+
+        assert sessions[0]["session_id"] == session_id
+        assert sessions[0]["title"] == "cache check"
+        assert await database.delete_session(session_id)
+        assert await database.list_sessions(limit=5) == []
+    finally:
+        await database.close_db()
@@ -0,0 +1,20 @@
+from app.clients.html_utils import html_to_text
+
+
+def test_html_to_text_strips_markup_and_decodes_entities():
+    html = (
+        "<html><head><title>x</title></head><body>"
+        "<script>alert(1)</script><p>Tariff &amp; trade&#46;</p>"
+        "<div>Section&#x20;2\t\ttext</div>\n\n\n\n<p>Last</p></body></html>"
+    )
+
+    assert html_to_text(html) == "Tariff & trade.\nSection 2 text\n\nLast"
+
+
+def test_html_to_text_prefix_cut_drops_unclosed_script():
+    html = "<p>" + "word " * 300 + "</p><script>" + "x" * 50000 + "</script><p>tail</p>"
+
+    text = html_to_text(html, max_length=1000)
+
+    assert "xxx" not in text
+    assert text.endswith("[Content truncated due to length...]")
@@ -0,0 +1,160 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients import web_fetcher
+from app.clients.web_fetcher import WebFetcher
+from app.config import get_settings
+
+
+def _fetcher_with_handler(monkeypatch, handler) -> WebFetcher:
+    monkeypatch.setenv("ALLOW_LOCAL_FETCH", "true")
+    get_settings.cache_clear()
+    fetcher = WebFetcher()
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return fetcher
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_coalesces_and_caches(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(
+            200,
+            text="<html><title>Doc</title><body>Hello</body></html>",
+            headers={"content-type": "text/html; charset=utf-8"},
+        )
+
+    fetcher = _fetcher_with_handler(monkeypatch, handler)
+    url = "https://example.gov/coalesce"
+    web_fetcher._fetch_result_cache.clear()
+
+    first, second = await asyncio.gather(fetcher.fetch_url(url), fetcher.fetch_url(url))
+    first["text"] = "mutated"
+    third = await fetcher.fetch_url(url)
+
+    assert len(calls) == 1
+    assert second["title"] == third["title"] == "Doc"
+    assert third["text"] != "mutated"
+    web_fetcher._fetch_result_cache.clear()
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_oversized_pdf_rejected_from_head(monkeypatch):
+    methods = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        return httpx.Response(200, headers={"content-length": "999999999"})
+
+    fetcher = _fetcher_with_handler(monkeypatch, handler)
+    result = await fetcher.fetch_url("https://example.gov/huge.pdf")
+
+    assert methods == ["HEAD"]
+    assert "too large" in result["error"]
+    get_settings.cache_clear()
+
+
+def test_regex_fallback_prefers_main_inside_content_div(monkeypatch):
+    monkeypatch.setattr(web_fetcher, "_SELECTOLAX_AVAILABLE", False)
+    main_text = "x" * 600
+    html = f'<title>Doc</title><div class="content">Menu <main>{main_text}</main></div>'
+
+    title, content = WebFetcher()._extract_title_and_main(html)
+
+    assert title == "Doc"
+    assert content == main_text
+
+
+@pytest.mark.asyncio
+async def test_oversized_html_truncated_to_byte_cap(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="a" * 5000, headers={"content-type": "text/html"})
+
+    fetcher = _fetcher_with_handler(monkeypatch, handler)
+    async with fetcher._client.stream("GET", "https://example.gov/big") as response:
+        content = await fetcher._read_response_bytes(response, 1000)
+
+    assert content == b"a" * 1000
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_unsupported_content_type_skips_body(monkeypatch):
+    streamed = []
+
+    async def body():
+        streamed.append(True)
+        yield b"\x00" * 1024
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body(), headers={"content-type": "video/mp4"})
+
+    fetcher = _fetcher_with_handler(monkeypatch, handler)
+    result = await fetcher.fetch_url("https://example.gov/clip")
+
+    assert "Unsupported content type" in result["error"]
+    assert streamed == []
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_best_file_format_races_top_two_and_caches_winner(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, text="<html><body>Rule text</body></html>", headers={"content-type": "text/html"})
+
+    fetcher = _fetcher_with_handler(monkeypatch, handler)
+    web_fetcher._fetch_result_cache.clear()
+    formats = [
+        {"format": "pdf", "fileUrl": "https://example.gov/doc.pdf"},
+        {"format": "txt", "fileUrl": "https://example.gov/doc.txt"},
+        {"format": "html", "fileUrl": "https://example.gov/doc.html"},
+    ]
+
+    result = await fetcher._fetch_best_file_format(formats, max_length=1000)
+
+    assert result["text"] == "Rule text"
+    assert "/doc.pdf" not in calls
+    assert ("https://example.gov/doc.html", 1000, True) in web_fetcher._fetch_result_cache
+
+    requests_made = len(calls)
+    again = await fetcher._fetch_best_file_format(formats, max_length=1000)
+
+    assert again["text"] == "Rule text"
+    assert len(calls) == requests_made
+    web_fetcher._fetch_result_cache.clear()
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_pdf_sniffed_under_unusual_content_type(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=b"%PDF-1.4\n%%EOF",
+            headers={"content-type": "application/x-download"},
+        )
+
+    async def fake_pdf_task(func, content, *args):
+        if func is web_fetcher.extract_pdf_text_sync:
+            return "Rule text"
+        return [], 0
+
+    monkeypatch.setattr(web_fetcher, "run_pdf_task", fake_pdf_task)
+    fetcher = _fetcher_with_handler(monkeypatch, handler)
+    web_fetcher._fetch_result_cache.clear()
+
+    result = await fetcher.fetch_url("https://example.gov/download?id=1")
+
+    assert result["error"] is None
+    assert result["content_format"] == "pdf"
+    assert result["text"] == "Rule text"
+    web_fetcher._fetch_result_cache.clear()
+    get_settings.cache_clear()